@@ -1,10 +1,82 @@
 import asyncio
-from playwright.async_api import async_playwright, Frame, Locator
-from typing import Union, List, Tuple # Import Union, List, and Tuple
+import base64
+import functools
+import hashlib
+import logging
+import os
+import sys
+from collections import deque
+from pathlib import Path
+from playwright.async_api import async_playwright, Frame, Locator, Page
+from typing import Awaitable, Callable, Union, List, Tuple # Import Union, List, and Tuple
+
+# The OCR modules live in the sibling OCR project; make them importable from here.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ollama-ocr-slots"))
+from ocr_client import SCORE_REGION, OcrClient
+
+logger = logging.getLogger(__name__)
+
+USE_OCR_SERVER = os.environ.get("USE_OCR_SERVER") == "1" # Send OCR to a running ocr_server.py instead
+
+GAME_URL = "https://cdn-3.launcher.a8r.games/index.html?fullscreen=false&options=eyJsYXVuY2hfb3B0aW9ucyI6eyJnYW1lX3VybCI6Imh0dHBzOi8vZ3Byb3V0ZXIuZ3Jvb3ZlZ2FtaW5nLmNvbS9nYW1lP2FjY291bnRpZD1cdTAwMjZjb3VudHJ5PVx1MDAyNmRldmljZV90eXBlPWRlc2t0b3BcdTAwMjZob21ldXJsPWh0dHBzJTNBJTJGJTJGbmF0Y2FzaW5mby5jb20lMkZlbiUyRmNhc2lubyUyRmdhbWUlMkZleGl0XHUwMDI2aXNfdGVzdF9hY2NvdW50PWZhbHNlXHUwMDI2bGljZW5zZT1DdXJhY2FvXHUwMDI2bm9nc2N1cnJlbmN5PUVVUlx1MDAyNm5vZ3NnYW1laWQ9ODIxMDAyNTZcdTAwMjZub2dzbGFuZz1lbl9VU1x1MDAyNm5vZ3Ntb2RlPWRlbW9cdTAwMjZub2dzb3BlcmF0b3JpZD0zMTkxXHUwMDI2c2Vzc2lvbmlkPWNiMjNiMzUyLTU1MWYtNDhjYy05MTc3LTQ5NzZiYzhkZDI4YiIsInN0cmF0ZWd5IjoiaWZyYW1lIn0sImxhdW5jaGVyX3ZlcnNpb24iOiJtYXN0ZXIiLCJsb2JieV90b2tlbiI6IjFmY2I1MmRiLTJmNTAtNGZmMC05YmI4LWE5Zjg2ODAifQ%3D%3D"
+INTRO_CLICK_X = 550 # Click that dismisses the game's intro screen
+INTRO_CLICK_Y = 468
+ROUND_COUNT = 10 # Number of rounds to play in one session
+OCR_QUEUE_SIZE = 4 # Frames allowed to wait for OCR before capture blocks
+LOAD_TIMEOUT = 30.0 # Seconds to wait for the game canvas to appear and render
+SETTLE_TIMEOUT = 10.0 # Seconds to wait for the canvas to stop changing
+SETTLE_POLL_INTERVAL = 0.25 # Seconds between canvas stability checks
+SETTLE_STABLE_POLLS = 3 # Consecutive identical canvas snapshots that count as settled
+SPIN_START_TIMEOUT = 5.0 # Seconds to wait for the canvas to start changing after Play
+
+# Copies the score region of the canvas into a scratch 2D canvas and returns its raw RGBA
+# pixels base64-encoded, skipping the PNG encode/decode of a screenshot. Going through
+# drawImage works for both 2D and WebGL game canvases.
+SCORE_PIXELS_JS = """
+(canvas, [x1, y1, x2, y2]) => {
+    const sx = Math.round(canvas.width * x1), sy = Math.round(canvas.height * y1);
+    const width = Math.round(canvas.width * (x2 - x1)), height = Math.round(canvas.height * (y2 - y1));
+    const scratch = document.createElement('canvas');
+    scratch.width = width;
+    scratch.height = height;
+    const context = scratch.getContext('2d');
+    context.drawImage(canvas, sx, sy, width, height, 0, 0, width, height);
+    const pixels = new Uint8Array(context.getImageData(0, 0, width, height).data.buffer);
+    let binary = '';
+    for (let i = 0; i < pixels.length; i += 0x8000) {
+        binary += String.fromCharCode.apply(null, pixels.subarray(i, i + 0x8000));
+    }
+    return { width, height, data: btoa(binary) };
+}
+"""
+
+async def probe_frame_for_canvas(frame: Frame) -> Union[Tuple[Frame, Locator], None]:
+    """
+    Checks a single frame for a visible 'canvas' element.
+
+    Args:
+        frame (Frame): The Playwright Frame to probe.
+
+    Returns:
+        Union[Tuple[Frame, Locator], None]: The Frame and its canvas Locator, or None.
+    """
+    try:
+        # Playwright uses locators for element selection. .first ensures we get the first one.
+        canvas = frame.locator("canvas").first
+        if await canvas.is_visible(): # Check if the canvas element exists and is visible
+            return frame, canvas
+    except Exception:
+        # Ignore inaccessible frames or elements not found (e.g., frame not fully loaded)
+        pass
+    return None
 
 async def find_canvas_in_frames(frames: List[Frame]) -> Union[Tuple[Frame, Locator], None]:
     """
-    Recursively searches for a 'canvas' element within a list of Frame objects and their children.
+    Searches for a 'canvas' element within a list of Frame objects and their children.
+
+    The frame tree is flattened breadth-first and every frame is probed concurrently,
+    so the search costs one browser round-trip instead of one per frame. The first
+    probe to find a visible canvas wins and the others are cancelled.
 
     Args:
         frames (List[Frame]): A list of Playwright Frame objects to search within.
@@ -13,97 +85,406 @@ async def find_canvas_in_frames(frames: List[Frame]) -> Union[Tuple[Frame, Locat
         Union[Tuple[Frame, Locator], None]: A tuple containing the Frame and the
                                             found canvas Locator, or None if no canvas is found.
     """
-    for frame in frames:
-        try:
-            # Playwright uses locators for element selection. .first ensures we get the first one.
-            canvas = frame.locator("canvas").first
-            if await canvas.is_visible(): # Check if the canvas element exists and is visible
-                return frame, canvas
-        except Exception:
-            # Ignore inaccessible frames or elements not found (e.g., frame not fully loaded)
-            pass
-
-        # Recursively search in child frames (Frame objects have child_frames())
-        child_frames = frame.child_frames
-        if child_frames: # child_frames is a property, not a method, so no parentheses needed
-            result = await find_canvas_in_frames(child_frames)
+    # page.frames already lists every descendant, but walk child_frames anyway so
+    # callers can pass just a subtree root.
+    all_frames: List[Frame] = []
+    seen = set()
+    pending = deque(frames)
+    while pending:
+        frame = pending.popleft()
+        if frame in seen:
+            continue
+        seen.add(frame)
+        all_frames.append(frame)
+        pending.extend(frame.child_frames) # child_frames is a property, not a method
+
+    tasks = [asyncio.create_task(probe_frame_for_canvas(frame)) for frame in all_frames]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
             if result:
                 return result
+    finally:
+        for task in tasks:
+            task.cancel()
     return None
 
-async def main():
+async def screenshot_score_region(page: Page, canvas: Locator) -> Union[bytes, None]:
+    """
+    Takes an in-memory screenshot of only the score region of the canvas, so the browser
+    encodes (and the OCR side decodes) just the pixels that matter and nothing touches
+    the disk.
+
+    Args:
+        page (Page): The Playwright page containing the canvas.
+        canvas (Locator): The game canvas locator.
+
+    Returns:
+        Union[bytes, None]: The PNG-encoded screenshot, or None if the canvas has no
+                            bounding box.
+    """
+    box = await canvas.bounding_box()
+    if not box:
+        return None
+
+    x1, y1, x2, y2 = SCORE_REGION
+    return await page.screenshot(
+        clip={
+            "x": box["x"] + x1 * box["width"],
+            "y": box["y"] + y1 * box["height"],
+            "width": (x2 - x1) * box["width"],
+            "height": (y2 - y1) * box["height"],
+        },
+    )
+
+async def grab_score_region_pixels(canvas: Locator) -> Union[Tuple[bytes, int, int], None]:
+    """
+    Reads the raw RGBA pixels of the score region straight from the canvas.
+
+    Args:
+        canvas (Locator): The game canvas locator.
+
+    Returns:
+        Union[Tuple[bytes, int, int], None]: The RGBA bytes with their width and height,
+                                             or None if the canvas cannot be read (tainted
+                                             by cross-origin content, or a WebGL canvas
+                                             whose drawing buffer was already cleared).
+    """
+    try:
+        result = await canvas.evaluate(SCORE_PIXELS_JS, list(SCORE_REGION))
+    except Exception:
+        return None
+
+    pixels = base64.b64decode(result["data"])
+    if not pixels[3::4].strip(b"\x00"): # Fully transparent: nothing was copied
+        return None
+    return pixels, result["width"], result["height"]
+
+@functools.lru_cache(maxsize=1)
+def get_ocr_client() -> OcrClient:
+    """
+    Returns the shared connection to the OCR server, opening it on first use.
+    """
+    return OcrClient()
+
+def make_ocr_job(buf: bytes, size: Union[Tuple[int, int], None] = None) -> Callable[[], Union[str, None]]:
+    """
+    Packages a captured score region as a blocking OCR call, run either in this process
+    or on the shared OCR server when USE_OCR_SERVER is set.
+
+    Args:
+        buf (bytes): A PNG screenshot, or raw RGBA pixels if `size` is given.
+        size (Union[Tuple[int, int], None]): The (width, height) of raw RGBA pixels.
+
+    Returns:
+        Callable[[], Union[str, None]]: A callable returning the score.
+    """
+    if USE_OCR_SERVER:
+        return functools.partial(get_ocr_client().read_score, buf, size, crop=False)
+
+    # Imported here so sessions using the OCR server never load torch and EasyOCR.
+    from score_reader import read_game_score_from_bytes, read_game_score_from_rgba
+    if size:
+        return functools.partial(read_game_score_from_rgba, buf, *size, crop=False)
+    return functools.partial(read_game_score_from_bytes, buf, crop=False)
+
+async def capture_score_region(page: Page, canvas: Locator) -> Union[Callable[[], Union[str, None]], None]:
+    """
+    Captures the score region, preferring raw canvas pixels and falling back to a
+    clipped screenshot, and packages it as an OCR job.
+
+    Args:
+        page (Page): The Playwright page containing the canvas.
+        canvas (Locator): The game canvas locator.
+
+    Returns:
+        Union[Callable[[], Union[str, None]], None]: A blocking callable that reads the
+                                                     score, or None if nothing could be
+                                                     captured.
+    """
+    pixels = await grab_score_region_pixels(canvas)
+    if pixels:
+        buf, width, height = pixels
+        return make_ocr_job(buf, (width, height))
+
+    screenshot = await screenshot_score_region(page, canvas)
+    if screenshot:
+        return make_ocr_job(screenshot)
+    return None
+
+async def wait_for_canvas(page: Page, timeout: float) -> Union[Tuple[Frame, Locator], None]:
+    """
+    Waits until a visible canvas exists in any frame and has been sized by the game,
+    instead of sleeping for a fixed worst-case load time.
+
+    Args:
+        page (Page): The Playwright page hosting the game.
+        timeout (float): Maximum number of seconds to wait.
+
+    Returns:
+        Union[Tuple[Frame, Locator], None]: The Frame and canvas Locator, or None on timeout.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        result = await find_canvas_in_frames(page.frames)
+        if result:
+            frame, canvas = result
+            # Playwright reads a timeout of 0 as "no timeout"; stop once the deadline passed.
+            remaining_ms = (deadline - loop.time()) * 1000
+            if remaining_ms < 1:
+                break
+            try:
+                await canvas.wait_for(state="visible", timeout=remaining_ms)
+                remaining_ms = max(1.0, (deadline - loop.time()) * 1000)
+                await frame.wait_for_function(
+                    "() => { const c = document.querySelector('canvas'); return c && c.width > 100; }",
+                    timeout=remaining_ms,
+                )
+                return result
+            except Exception:
+                # The frame navigated or timed out; fall through and search again
+                pass
+        await asyncio.sleep(SETTLE_POLL_INTERVAL)
+    return None
+
+def digest_snapshot(snapshot: Union[bytes, None]) -> Union[bytes, None]:
+    """
+    Hashes a snapshot so consecutive ones can be compared cheaply.
+    """
+    return hashlib.blake2b(snapshot, digest_size=16).digest() if snapshot else None
+
+async def wait_until_stable(snapshot: Callable[[], Awaitable[Union[bytes, None]]], timeout: float) -> bool:
+    """
+    Polls snapshots until several consecutive ones are identical, i.e. the game has
+    finished loading or animating, so callers wait only as long as needed.
+
+    Args:
+        snapshot (Callable[[], Awaitable[Union[bytes, None]]]): Takes one snapshot.
+        timeout (float): Maximum number of seconds to wait.
+
+    Returns:
+        bool: True if the snapshots settled, False if the timeout expired first.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    last_digest = None
+    stable_polls = 0
+    while loop.time() < deadline:
+        digest = digest_snapshot(await snapshot())
+        stable_polls = stable_polls + 1 if digest == last_digest else 0
+        if stable_polls >= SETTLE_STABLE_POLLS - 1:
+            return True
+        last_digest = digest
+        await asyncio.sleep(SETTLE_POLL_INTERVAL)
+    return False
+
+async def wait_until_changed(snapshot: Callable[[], Awaitable[Union[bytes, None]]], before: Union[bytes, None], timeout: float) -> bool:
+    """
+    Polls snapshots until one differs from `before`.
+
+    Args:
+        snapshot (Callable[[], Awaitable[Union[bytes, None]]]): Takes one snapshot.
+        before (Union[bytes, None]): The digest (see `digest_snapshot`) to compare against.
+        timeout (float): Maximum number of seconds to wait.
+
+    Returns:
+        bool: True if a snapshot changed, False if the timeout expired first.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        if digest_snapshot(await snapshot()) != before:
+            return True
+        await asyncio.sleep(SETTLE_POLL_INTERVAL)
+    return False
+
+async def wait_for_canvas_stable(canvas: Locator, timeout: float) -> bool:
+    """
+    Waits until the whole canvas stops changing; see `wait_until_stable`.
+    """
+    return await wait_until_stable(canvas.screenshot, timeout)
+
+async def snapshot_score_region(page: Page, canvas: Locator) -> Union[bytes, None]:
+    """
+    Takes a snapshot of just the score region, so animations elsewhere on the canvas
+    do not count as changes.
+
+    Args:
+        page (Page): The Playwright page containing the canvas.
+        canvas (Locator): The game canvas locator.
+
+    Returns:
+        Union[bytes, None]: The region's raw pixels (or a clipped screenshot if the canvas
+                            cannot be read), or None if neither could be taken.
+    """
+    pixels = await grab_score_region_pixels(canvas)
+    if pixels:
+        return pixels[0]
+    return await screenshot_score_region(page, canvas)
+
+class GameSession:
     """
-    Main asynchronous function to launch the browser, navigate, interact with a canvas,
-    take screenshots, and close the browser.
+    Keeps one browser with the game loaded open across rounds, so launching Chromium and
+    loading the game are paid once instead of once per spin.
+
+    Usage:
+        async with GameSession() as session:
+            ocr_job = await session.play_round()
     """
-    async with async_playwright() as p:
-        # Launch Chromium browser in non-headless mode with no default viewport
-        browser = await p.chromium.launch(headless=False)
-        page = await browser.new_page()
 
-        # Navigate to the URL and wait until the network is idle
-        print("Navigating to URL...")
-        await page.goto(
-            "https://cdn-3.launcher.a8r.games/index.html?fullscreen=false&options=eyJsYXVuY2hfb3B0aW9ucyI6eyJnYW1lX3VybCI6Imh0dHBzOi8vZ3Byb3V0ZXIuZ3Jvb3ZlZ2FtaW5nLmNvbS9nYW1lP2FjY291bnRpZD1cdTAwMjZjb3VudHJ5PVx1MDAyNmRldmljZV90eXBlPWRlc2t0b3BcdTAwMjZob21ldXJsPWh0dHBzJTNBJTJGJTJGbmF0Y2FzaW5mby5jb20lMkZlbiUyRmNhc2lubyUyRmdhbWUlMkZleGl0XHUwMDI2aXNfdGVzdF9hY2NvdW50PWZhbHNlXHUwMDI2bGljZW5zZT1DdXJhY2FvXHUwMDI2bm9nc2N1cnJlbmN5PUVVUlx1MDAyNm5vZ3NnYW1laWQ9ODIxMDAyNTZcdTAwMjZub2dzbGFuZz1lbl9VU1x1MDAyNm5vZ3Ntb2RlPWRlbW9cdTAwMjZub2dzb3BlcmF0b3JpZD0zMTkxXHUwMDI2c2Vzc2lvbmlkPWNiMjNiMzUyLTU1MWYtNDhjYy05MTc3LTQ5NzZiYzhkZDI4YiIsInN0cmF0ZWd5IjoiaWZyYW1lIn0sImxhdW5jaGVyX3ZlcnNpb24iOiJtYXN0ZXIiLCJsb2JieV90b2tlbiI6IjFmY2I1MmRiLTJmNTAtNGZmMC05YmI4LWE5Zjg2ODAifQ%3D%3D",
-            wait_until="networkidle",
-            timeout=0 # No timeout
-        )
+    def __init__(self, url: str = GAME_URL, headless: bool = False):
+        self.url = url
+        self.headless = headless
+        self.page: Union[Page, None] = None
+        self.canvas: Union[Locator, None] = None
+        self._playwright = None
+        self._browser = None
+        self._rounds_played = 0
 
-        print("Waiting for game to fully load (20 seconds)...")
-        await asyncio.sleep(20) # wait for game to fully load
+    @property
+    def rounds_played(self) -> int:
+        """The number of rounds played so far, including ones whose capture failed."""
+        return self._rounds_played
 
-        # Get all Frame objects on the page and find the canvas within them
-        all_frames = page.frames # page.frames returns a list of Frame objects
-        result = await find_canvas_in_frames(all_frames)
+    async def __aenter__(self) -> "GameSession":
+        """
+        Launches the browser, loads the game and dismisses the intro screen.
+
+        Raises:
+            RuntimeError: If no game canvas shows up within LOAD_TIMEOUT.
+        """
+        self._playwright = await async_playwright().start()
+        try:
+            # Launch Chromium browser in non-headless mode with no default viewport
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            self.page = await self._browser.new_page()
 
-        if not result:
-            print("❌ No canvas found in any frame.")
-            await browser.close()
-            return
+            # Navigate to the URL and wait until the network is idle
+            logger.info("Navigating to URL...")
+            await self.page.goto(self.url, wait_until="networkidle", timeout=0) # No timeout
 
-        frame, canvas = result
+            logger.info("Waiting for game to load...")
+            result = await wait_for_canvas(self.page, LOAD_TIMEOUT)
+            if not result:
+                raise RuntimeError("No canvas found in any frame.")
 
-        print(f"✅ Canvas found in frame: {frame.url}")
+            frame, self.canvas = result
+            logger.info("✅ Canvas found in frame: %s", frame.url)
 
-        # Take a screenshot of the canvas before clicks
-        await canvas.screenshot(path="canvas_before_clicks.png")
-        print("📸 Screenshot saved as canvas_before_clicks.png")
+            if not await wait_for_canvas_stable(self.canvas, SETTLE_TIMEOUT):
+                logger.warning("⚠️ Canvas still changing, continuing anyway.")
 
-        # First click coordinates
-        first_click_x = 550
-        first_click_y = 468
+            # Click on the page at the intro screen coordinates
+            await self.page.mouse.click(INTRO_CLICK_X, INTRO_CLICK_Y)
+            logger.debug("🎯 Clicked canvas at (%d, %d)", INTRO_CLICK_X, INTRO_CLICK_Y)
 
-        # Click on the page at the specified coordinates
-        await page.mouse.click(first_click_x, first_click_y)
-        print(f"🎯 Clicked canvas at ({first_click_x}, {first_click_y})")
+            logger.debug("Waiting for canvas to settle...")
+            await wait_for_canvas_stable(self.canvas, SETTLE_TIMEOUT)
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
+        return self
 
-        print("Waiting for 3 seconds...")
-        await asyncio.sleep(3) # wait 3 seconds
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+            logger.info("Browser closed.")
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
 
-        # Get canvas bounding box again to calculate bottom center for Play button click
-        box = await canvas.bounding_box()
+    async def play_round(self) -> Union[Callable[[], Union[str, None]], None]:
+        """
+        Clicks Play, waits for the spin to start and the score region to settle, and
+        captures it.
+
+        The score (the GRAND jackpot) rarely changes on a spin, so the start of the spin
+        is detected on the whole canvas; only the settle check watches the score region.
+
+        Returns:
+            Union[Callable[[], Union[str, None]], None]: A blocking callable that reads the
+                                                         score (see `capture_score_region`),
+                                                         or None if nothing was captured.
+        """
+        # Get canvas bounding box to calculate bottom center for Play button click
+        box = await self.canvas.bounding_box()
         if not box:
-            print("⚠️ Unable to get bounding box of canvas for second click.")
-            await browser.close()
-            return
+            logger.warning("⚠️ Unable to get bounding box of canvas for Play click.")
+            return None
+
+        # Calculate coordinates for the Play click (bottom center of the canvas, 20px up)
+        play_x = box["x"] + box["width"] / 2
+        play_y = box["y"] + box["height"] - 20
 
-        # Calculate coordinates for the second click (bottom center of the canvas, 20px up)
-        second_click_x = box["x"] + box["width"] / 2
-        second_click_y = box["y"] + box["height"] - 20
+        before = digest_snapshot(await self.canvas.screenshot())
 
         # Click the "Play" button area
-        await page.mouse.click(second_click_x, second_click_y)
-        print(f"🎯 Clicked Play button at ({second_click_x:.1f}, {second_click_y:.1f})")
+        await self.page.mouse.click(play_x, play_y)
+        logger.debug("🎯 Clicked Play button at (%.1f, %.1f)", play_x, play_y)
 
-        print("Waiting for 5 seconds for game to start/render...")
-        await asyncio.sleep(5) # wait 5 seconds for game to start/render
+        # Waiting for a change first keeps a delayed spin from passing for a settled one.
+        logger.debug("Waiting for spin to finish...")
+        if not await wait_until_changed(self.canvas.screenshot, before, SPIN_START_TIMEOUT):
+            logger.warning("⚠️ Canvas unchanged %.1fs after Play.", SPIN_START_TIMEOUT)
+        snapshot = functools.partial(snapshot_score_region, self.page, self.canvas)
+        if not await wait_until_stable(snapshot, SETTLE_TIMEOUT):
+            logger.warning("⚠️ Score region still changing, capturing anyway.")
 
-        # Final screenshot after clicks
-        await canvas.screenshot(path="canvas_after_clicks.png")
-        print("📸 Screenshot saved as canvas_after_clicks.png")
+        self._rounds_played += 1
+        ocr_job = await capture_score_region(self.page, self.canvas)
+        if ocr_job:
+            logger.debug("📸 Captured score for round %d", self._rounds_played)
+        return ocr_job
 
-        await browser.close()
-        print("Browser closed.")
+async def play_rounds(session: GameSession, queue: asyncio.Queue, count: int):
+    """
+    Producer: plays `count` rounds and hands each captured score, tagged with its round
+    number, to the OCR consumer through `queue`, finishing with a None sentinel.
+
+    Args:
+        session (GameSession): The open game session.
+        queue (asyncio.Queue): Queue shared with `read_scores_from_queue`.
+        count (int): Number of rounds to play.
+    """
+    try:
+        for _ in range(count):
+            ocr_job = await session.play_round()
+            if ocr_job:
+                # Blocks while the OCR consumer is behind
+                await queue.put((session.rounds_played, ocr_job))
+    finally:
+        await queue.put(None)
+
+async def read_scores_from_queue(queue: asyncio.Queue):
+    """
+    Consumer: runs each queued OCR job in a worker thread, so the next spin
+    plays out in the browser while EasyOCR is busy with the previous one.
+
+    Args:
+        queue (asyncio.Queue): Queue fed by `play_rounds`.
+    """
+    while (item := await queue.get()) is not None:
+        round_number, ocr_job = item
+        score = await asyncio.to_thread(ocr_job)
+        logger.info("🔢 Round %d: %s", round_number, score)
+
+async def main():
+    """
+    Main asynchronous function to open a game session, play several rounds and read
+    the score after each one.
+    """
+    try:
+        async with GameSession() as session:
+            queue = asyncio.Queue(maxsize=OCR_QUEUE_SIZE)
+            await asyncio.gather(
+                play_rounds(session, queue, ROUND_COUNT),
+                read_scores_from_queue(queue),
+            )
+    except RuntimeError as e:
+        logger.error("❌ %s", e)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
@@ -0,0 +1,228 @@
+import functools
+import logging
+import os
+import threading
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "digit_templates")
+
+# Every glyph and template is normalized to this (width, height) before matching.
+TEMPLATE_SIZE = (24, 32)
+
+# Connected components smaller than this many pixels are treated as speckle.
+MIN_GLYPH_AREA = 4
+
+# Structuring element for the speckle-removing morphological opening.
+_OPEN_KERNEL = np.ones((2, 2), np.uint8)
+
+# Lowest per-glyph match score accepted before falling back to EasyOCR.
+MATCH_THRESHOLD = 0.8
+
+# Labelled glyphs kept per label; they are averaged into that label's single template.
+MAX_SAMPLES_PER_LABEL = 50
+
+# Template labels map to on-disk directory names ('.' is not a friendly directory name).
+_LABEL_DIRS = {str(d): str(d) for d in range(10)}
+_LABEL_DIRS['.'] = "dot"
+
+# Per-thread scratch arrays reused across frames: the latest one per name.
+_scratch = threading.local()
+
+
+def scratch_buffer(name, shape, dtype=np.uint8):
+    """
+    Returns a reusable per-thread array, so per-frame image steps write into the same
+    memory every time instead of allocating a fresh array per call.
+
+    Only the latest array per name is kept; it is replaced when a different shape or
+    dtype is requested, so a long-running process does not accumulate one array per crop
+    size it has ever seen. The contents are overwritten by the next call with the same
+    name, so the result must not be kept beyond the current frame.
+
+    Args:
+        name (str): Identifies the processing step that owns the buffer.
+        shape (tuple[int, ...]): The array shape.
+        dtype (numpy.dtype): The array dtype.
+
+    Returns:
+        numpy.ndarray: An uninitialized array of the requested shape and dtype.
+    """
+    buffers = getattr(_scratch, "buffers", None)
+    if buffers is None:
+        buffers = _scratch.buffers = {}
+
+    buffer = buffers.get(name)
+    if buffer is None or buffer.shape != tuple(shape) or buffer.dtype != dtype:
+        buffer = buffers[name] = np.empty(shape, dtype=dtype)
+    return buffer
+
+
+def _output_buffer(name, image):
+    """
+    Returns the scratch buffer for a step's output on a numpy image, or None for a UMat,
+    whose outputs OpenCV allocates on the OpenCL device itself.
+    """
+    return None if isinstance(image, cv2.UMat) else scratch_buffer(name, image.shape[:2])
+
+
+def binarize(image):
+    """
+    Converts a BGR or grayscale image into a binary mask with the glyphs in white,
+    using an Otsu threshold followed by a small opening to drop isolated speckle.
+
+    Args:
+        image (numpy.ndarray | cv2.UMat): The BGR or single-channel score crop. A UMat
+                                          must be BGR; it is processed on the OpenCL
+                                          device.
+
+    Returns:
+        numpy.ndarray | cv2.UMat: A uint8 mask where glyph pixels are 255 and background
+                                  is 0, of the same type as `image`. A numpy result is a
+                                  scratch buffer (see `scratch_buffer`); copy it to keep it.
+    """
+    if isinstance(image, cv2.UMat) or image.ndim == 3:
+        gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=_output_buffer("gray", image))
+    else:
+        gray_image = image
+    _, binary = cv2.threshold(gray_image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=_output_buffer("binary", image))
+
+    # Glyphs cover less area than the background; make sure they end up white.
+    if cv2.mean(binary)[0] > 127.5:
+        binary = cv2.bitwise_not(binary, dst=_output_buffer("binary", image))
+    return cv2.morphologyEx(binary, cv2.MORPH_OPEN, _OPEN_KERNEL, dst=_output_buffer("opened", image))
+
+
+def _touches_edge(box, width, height):
+    x, y, w, h = box
+    return x == 0 or y == 0 or x + w == width or y + h == height
+
+
+def segment_glyphs(binary):
+    """
+    Splits a binary mask into the glyphs of the score line, left to right.
+
+    Components touching the crop's edge (the frame of the score strip) are dropped, and
+    only components centred within the vertical band of the tallest one are kept, so
+    nothing above or below the score line is mistaken for a glyph. Each glyph keeps the
+    full band spanned by the kept glyphs, so a '.' stays a small blob at the bottom
+    rather than being stretched into a digit-sized block.
+
+    Args:
+        binary (numpy.ndarray): A mask as returned by `binarize`.
+
+    Returns:
+        list[numpy.ndarray]: Glyphs normalized to TEMPLATE_SIZE as float32 arrays.
+    """
+    count, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    height, width = binary.shape
+
+    # Label 0 is the background.
+    boxes = [
+        stats[i, :4] for i in range(1, count)
+        if stats[i, cv2.CC_STAT_AREA] >= MIN_GLYPH_AREA and not _touches_edge(stats[i, :4], width, height)
+    ]
+    if not boxes:
+        return []
+
+    tallest = max(boxes, key=lambda box: box[3])
+    line_top, line_bottom = tallest[1], tallest[1] + tallest[3]
+    boxes = [box for box in boxes if line_top <= box[1] + box[3] / 2 <= line_bottom]
+
+    boxes.sort(key=lambda box: box[0])
+    band_top = min(box[1] for box in boxes)
+    band_bottom = max(box[1] + box[3] for box in boxes)
+
+    return [
+        cv2.resize(binary[band_top:band_bottom, x:x + w], TEMPLATE_SIZE, interpolation=cv2.INTER_AREA).astype(np.float32)
+        for x, _, w, _ in boxes
+    ]
+
+
+def _normalize(vectors):
+    """
+    Centres each row and scales it to unit length, so the dot product of two rows is
+    their normalized cross-correlation (what `cv2.TM_CCOEFF_NORMED` computes for two
+    images of the same size).
+    """
+    vectors = vectors - vectors.mean(axis=1, keepdims=True)
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-6)
+
+
+@functools.lru_cache(maxsize=1)
+def load_templates(directory=TEMPLATES_DIR):
+    """
+    Loads the digit templates collected by `score_reader.collect_digit_templates`,
+    averaging the samples of each label into a single template.
+
+    Args:
+        directory (str): The templates root, with one sub-directory per label.
+
+    Returns:
+        tuple[tuple[str, ...], numpy.ndarray]: The labels, and one normalized, flattened
+                                               template per label as the rows of a
+                                               float32 matrix; both empty if none were
+                                               collected.
+    """
+    labels = []
+    templates = []
+    for label, label_dir in _LABEL_DIRS.items():
+        path = os.path.join(directory, label_dir)
+        if not os.path.isdir(path):
+            continue
+        samples = [cv2.imread(os.path.join(path, name), cv2.IMREAD_GRAYSCALE) for name in sorted(os.listdir(path))]
+        samples = [sample.astype(np.float32) for sample in samples if sample is not None]
+        if samples:
+            labels.append(label)
+            templates.append(np.mean(samples, axis=0).ravel())
+
+    logger.debug("Loaded digit templates for labels: %s", labels)
+    if not labels:
+        return (), np.empty((0, TEMPLATE_SIZE[0] * TEMPLATE_SIZE[1]), dtype=np.float32)
+    return tuple(labels), _normalize(np.array(templates, dtype=np.float32))
+
+
+def save_templates(glyphs, text, directory=TEMPLATES_DIR):
+    """
+    Stores labelled glyphs as template samples, up to MAX_SAMPLES_PER_LABEL per label.
+
+    Args:
+        glyphs (list[numpy.ndarray]): Glyphs from `segment_glyphs`, one per character of `text`.
+        text (str): The label for each glyph, e.g. '1000.00'.
+        directory (str): The templates root.
+    """
+    for glyph, label in zip(glyphs, text):
+        path = os.path.join(directory, _LABEL_DIRS[label])
+        os.makedirs(path, exist_ok=True)
+        sample_count = len(os.listdir(path))
+        if sample_count < MAX_SAMPLES_PER_LABEL:
+            cv2.imwrite(os.path.join(path, f"{sample_count}.png"), glyph.astype(np.uint8))
+
+
+def match_digits(image, templates):
+    """
+    Reads the score by matching every glyph against every label's template at once.
+
+    Args:
+        image (numpy.ndarray): The BGR or single-channel score crop.
+        templates (tuple[tuple[str, ...], numpy.ndarray]): Templates from `load_templates`.
+
+    Returns:
+        tuple[str, float]: The recognized text and the lowest per-glyph match score
+                           (0.0 if nothing could be matched).
+    """
+    labels, template_matrix = templates
+    if not labels:
+        return "", 0.0
+
+    glyphs = segment_glyphs(binarize(image))
+    if not glyphs:
+        return "", 0.0
+
+    # One matrix product scores every (glyph, template) pair.
+    scores = _normalize(np.stack(glyphs).reshape(len(glyphs), -1)) @ template_matrix.T
+    best = scores.argmax(axis=1)
+    text = "".join(labels[index] for index in best)
+    return text, float(scores[np.arange(len(glyphs)), best].min())
@@ -0,0 +1,65 @@
+import os
+import threading
+from multiprocessing.connection import Client
+
+# Everything a game session needs to capture the score and talk to the OCR server. Kept
+# free of torch/EasyOCR imports, so sessions using the server do not load the models.
+
+# Score region as fractions of the canvas: (x1, y1, x2, y2), each within [0, 1]. This is
+# the GRAND value strip, a single text line: the recognizer reads it as one box without
+# detection. On game_screenshot.png (1200x836) the digits span x 82-215, y 211-242.
+SCORE_REGION = (0.03, 0.245, 0.22, 0.297)
+
+SERVER_ADDRESS = ("localhost", 6010)
+
+# Shared secret between the OCR server and its clients. Connections exchange pickles, so
+# anyone holding the key can run code in the server: there is deliberately no default.
+AUTHKEY = os.environ["OCR_SERVER_AUTHKEY"].encode() if os.environ.get("OCR_SERVER_AUTHKEY") else None
+
+
+def require_authkey(authkey):
+    """
+    Checks that an OCR server key was configured.
+
+    Args:
+        authkey (bytes | None): The key to check.
+
+    Returns:
+        bytes: The key.
+
+    Raises:
+        RuntimeError: If the key is missing or empty.
+    """
+    if not authkey:
+        raise RuntimeError("Set OCR_SERVER_AUTHKEY to a random secret shared by the OCR server and its clients.")
+    return authkey
+
+
+class OcrClient:
+    """
+    Connection to a running OCR server. Safe to share between threads; requests on one
+    client are sent one at a time.
+    """
+
+    def __init__(self, address=SERVER_ADDRESS, authkey=AUTHKEY):
+        self._conn = Client(address, authkey=require_authkey(authkey))
+        self._lock = threading.Lock()
+
+    def read_score(self, buf, size=None, crop=True):
+        """
+        Reads the game score from an in-memory image on the server.
+
+        Args:
+            buf (bytes): An encoded (PNG/JPEG) image, or raw RGBA pixels if `size` is given.
+            size (tuple[int, int] | None): The (width, height) of raw RGBA pixels.
+            crop (bool): If False, the image is taken to already be the score region.
+
+        Returns:
+            str | None: The score as returned by `score_reader.read_game_score_from_bytes`.
+        """
+        with self._lock:
+            self._conn.send((buf, size, crop))
+            return self._conn.recv()
+
+    def close(self):
+        self._conn.close()
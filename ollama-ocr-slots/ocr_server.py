@@ -0,0 +1,193 @@
+import logging
+import queue
+import socket
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, answer_challenge, deliver_challenge
+
+from ocr_client import AUTHKEY, SERVER_ADDRESS, require_authkey
+from score_reader import BATCH_SIZE, read_game_scores_from_buffers, warmup
+
+logger = logging.getLogger(__name__)
+
+# How long the server keeps collecting requests after the first one arrives before
+# running them as one batch.
+BATCH_WINDOW = 0.01
+
+# Seconds a new connection gets to complete the authkey handshake before it is dropped.
+HANDSHAKE_TIMEOUT = 5.0
+
+
+class _PendingRequest:
+    """A score request waiting for the batch worker, with a slot for its result."""
+
+    def __init__(self, buf, size, crop):
+        self.request = (buf, size, crop)
+        self.score = None
+        self.done = threading.Event()
+
+
+def _batch_worker(pending):
+    """
+    Collects requests for up to BATCH_WINDOW seconds (or BATCH_SIZE requests) and reads
+    them with a single batched OCR pass, so all clients share one reader and one CUDA
+    context.
+
+    Args:
+        pending (queue.Queue): Requests queued by the connection handlers.
+    """
+    while True:
+        batch = [pending.get()]
+        deadline = time.monotonic() + BATCH_WINDOW
+        while len(batch) < BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(pending.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            scores = read_game_scores_from_buffers([item.request for item in batch])
+        except Exception as e:
+            logger.error("Batched OCR failed: %s", e)
+            scores = [None] * len(batch)
+
+        logger.debug("Served a batch of %d request(s).", len(batch))
+        for item, score in zip(batch, scores):
+            item.score = score
+            item.done.set()
+
+
+def _shutdown(conn):
+    """Shuts a connection's socket down, waking any thread blocked reading from it."""
+    try:
+        with socket.fromfd(conn.fileno(), socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass # Already closed
+
+
+def _authenticate(conn, authkey):
+    """
+    Runs the authkey handshake `Listener.accept` would, but bounded by HANDSHAKE_TIMEOUT,
+    so a client that connects and then stalls cannot hold the connection open.
+
+    Args:
+        conn (multiprocessing.connection.Connection): The raw accepted connection.
+        authkey (bytes): The shared secret clients must present.
+
+    Returns:
+        bool: True if the client authenticated.
+    """
+    timer = threading.Timer(HANDSHAKE_TIMEOUT, _shutdown, args=(conn,))
+    timer.start()
+    try:
+        deliver_challenge(conn, authkey)
+        answer_challenge(conn, authkey)
+        return True
+    except (EOFError, OSError, AuthenticationError) as e:
+        logger.warning("Rejected OCR client: %s", str(e) or type(e).__name__)
+        return False
+    finally:
+        timer.cancel()
+
+
+def _parse_request(payload):
+    """
+    Validates a client request before it joins a batch, so one malformed request cannot
+    fail the reads of the other clients batched with it.
+
+    Args:
+        payload: The object received from the client.
+
+    Returns:
+        tuple[bytes, tuple[int, int] | None, bool] | None: The `(buf, size, crop)` request,
+                                                          or None if it is malformed.
+    """
+    try:
+        buf, size, crop = payload
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(buf, bytes):
+        return None
+    if size is not None:
+        try:
+            width, height = size
+        except (TypeError, ValueError):
+            return None
+        if not (isinstance(width, int) and isinstance(height, int)):
+            return None
+        size = (width, height)
+    return buf, size, bool(crop)
+
+
+def _handle_connection(conn, pending, authkey):
+    """
+    Authenticates one client connection and serves it until it closes.
+
+    Args:
+        conn (multiprocessing.connection.Connection): The raw accepted connection.
+        pending (queue.Queue): Queue feeding the batch worker.
+        authkey (bytes): The shared secret clients must present.
+    """
+    with conn:
+        if not _authenticate(conn, authkey):
+            return
+
+        while True:
+            try:
+                payload = conn.recv()
+            except EOFError:
+                return
+            except Exception as e:
+                logger.warning("Dropping OCR client after an unreadable message: %s", e)
+                return
+
+            request = _parse_request(payload)
+            if request is None:
+                logger.warning("Rejected a malformed OCR request.")
+                conn.send(None)
+                continue
+
+            item = _PendingRequest(*request)
+            pending.put(item)
+            item.done.wait()
+            conn.send(item.score)
+
+
+def serve(address=SERVER_ADDRESS, authkey=AUTHKEY):
+    """
+    Runs the OCR server: one process owning the EasyOCR reader, serving score requests
+    from any number of game sessions.
+
+    Args:
+        address (tuple[str, int]): The (host, port) to listen on.
+        authkey (bytes): The shared secret clients must present.
+
+    Raises:
+        RuntimeError: If no authkey is configured (see `ocr_client.AUTHKEY`).
+    """
+    authkey = require_authkey(authkey)
+    warmup() # Load the models and initialize CUDA before accepting clients
+    pending = queue.Queue()
+    threading.Thread(target=_batch_worker, args=(pending,), daemon=True).start()
+
+    # The handshake runs on each connection's own thread (see `_authenticate`), so a
+    # failing or stalled client never blocks the accept loop.
+    with Listener(address) as listener:
+        logger.info("OCR server listening on %s:%d", *address)
+        while True:
+            try:
+                conn = listener.accept()
+            except OSError as e:
+                logger.warning("Failed to accept an OCR client: %s", e)
+                continue
+            threading.Thread(target=_handle_connection, args=(conn, pending, authkey), daemon=True).start()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    serve()
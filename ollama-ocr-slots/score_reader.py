@@ -1,125 +1,862 @@
+import functools
 import torch
 
-# Monkey patch torch.load to enforce weights_only=True for security and silence warning
-_original_torch_load = torch.load
+# Monkey patch torch.load to enforce weights_only=True for security and silence warning.
+# Guarded so re-importing or reloading this module does not wrap torch.load twice.
+if not getattr(torch.load, "_weights_only_patched", False):
+    _original_torch_load = torch.load
 
-def torch_load_weights_only(*args, **kwargs):
-    if 'weights_only' not in kwargs:
-        kwargs['weights_only'] = True
-    return _original_torch_load(*args, **kwargs)
+    @functools.wraps(_original_torch_load)
+    def torch_load_weights_only(*args, **kwargs):
+        kwargs.setdefault('weights_only', True)
+        return _original_torch_load(*args, **kwargs)
 
-torch.load = torch_load_weights_only
+    torch_load_weights_only._weights_only_patched = True
+    torch.load = torch_load_weights_only
 
+import collections
+import hashlib
+import io
+import logging
 import os
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import easyocr
+import numpy as np
+from ocr_client import SCORE_REGION
+from digit_matcher import MATCH_THRESHOLD, binarize, load_templates, match_digits, save_templates, scratch_buffer, segment_glyphs
 
-def read_game_score_custom_crop(image_path):
+try:
+    # Pillow (or the Pillow-SIMD drop-in) decodes PNGs with SIMD inflate/colour conversion.
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    # xxh3 hashes crops at several GB/s; hashlib's blake2b is the slower fallback.
+    import xxhash
+except ImportError:
+    xxhash = None
+
+logger = logging.getLogger(__name__)
+
+cv2.setUseOptimized(True)
+cv2.setNumThreads(os.cpu_count() or 1)
+
+# Set SCORE_READER_OPENCL=1 to run the resize/threshold chain on an OpenCL device through
+# UMat (T-API). Off by default: each crop is uploaded and downloaded on its own, and for
+# crops this small the transfers can cost more than the CPU path.
+_USE_OPENCL = os.environ.get("SCORE_READER_OPENCL") == "1" and cv2.ocl.haveOpenCL()
+if _USE_OPENCL:
+    cv2.ocl.setUseOpenCL(True)
+
+BATCH_SIZE = 16
+
+# Set SCORE_READER_DEBUG=1 to write every crop to disk, as if debug=True was passed.
+DEBUG = os.environ.get("SCORE_READER_DEBUG") == "1"
+
+# Screenshot files are decoded at 1/DECODE_REDUCTION of their size (1, 2, 4 or 8). Only
+# raise it for captures much larger than game_screenshot.png: there the score digits are
+# about 32 px tall at full size, already below the recognizer's RECOGNIZER_HEIGHT.
+DECODE_REDUCTION = 1
+
+_IMREAD_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+# Threads decoding the next chunk of screenshots while the current one is read.
+DECODE_WORKERS = 2
+
+# States of the score scanner in `_scan_scores`.
+_START, _WORD, _INT, _DOT, _FRAC1, _FRAC2 = range(6)
+
+# Number of recently read score regions remembered by pixel hash.
+SCORE_CACHE_SIZE = 1024
+
+
+def _fuzzy_cache_distance():
+    """Parses SCORE_READER_FUZZY_CACHE; None (fuzzy cache off) if unset or invalid."""
+    value = os.environ.get("SCORE_READER_FUZZY_CACHE")
+    if not value:
+        return None
+    try:
+        distance = int(value)
+    except ValueError:
+        distance = -1
+    if not 0 <= distance <= 64:
+        logger.warning("Ignoring SCORE_READER_FUZZY_CACHE=%r: expected a bit count from 0 to 64.", value)
+        return None
+    return distance
+
+
+# Set SCORE_READER_FUZZY_CACHE=<bits> to also reuse the score of a crop whose 8x8 average
+# hash differs from a cached one by at most that many bits. Off by default: a single
+# changed digit may only flip a bit or two of the hash.
+FUZZY_CACHE_DISTANCE = _fuzzy_cache_distance()
+
+# EasyOCR's recognizer reads text lines scaled to this height.
+RECOGNIZER_HEIGHT = 64
+
+_score_cache = collections.OrderedDict()
+_fuzzy_score_cache = collections.OrderedDict() # Average hash -> score
+_score_cache_lock = threading.Lock()
+
+
+def _to_float(outputs):
+    """Casts floating-point tensors (possibly nested in tuples/lists) back to FP32."""
+    if torch.is_tensor(outputs):
+        return outputs.float() if outputs.is_floating_point() else outputs
+    if isinstance(outputs, (tuple, list)):
+        return type(outputs)(_to_float(item) for item in outputs)
+    return outputs
+
+
+class _HalfPrecisionModule(torch.nn.Module):
     """
-    Crops a specific region of the image where the game score is expected to be
-    and uses EasyOCR to read the score, handling decimal points.
+    Runs a wrapped EasyOCR model with FP16 weights and activations while keeping the
+    FP32 interface EasyOCR's pre- and post-processing expect.
+    """
+
+    def __init__(self, module):
+        super().__init__()
+        self.module = module.half()
+
+    def forward(self, *args, **kwargs):
+        args = [arg.half() if torch.is_tensor(arg) and arg.is_floating_point() else arg for arg in args]
+        return _to_float(self.module(*args, **kwargs))
+
+
+@functools.lru_cache(maxsize=1)
+def get_reader(gpu=True, half=True):
+    """
+    Returns the shared EasyOCR reader, loading the models on first use.
 
     Args:
-        image_path (str): The file path to the game screenshot image (e.g., 'game_screenshot.png').
+        gpu (bool): Whether EasyOCR should run on the GPU.
+        half (bool): Whether to run the detector and recognizer in FP16. Only applied
+                     on CUDA, where it halves the memory traffic of both models; the
+                     loss of precision does not affect digit recognition.
 
     Returns:
-        str: The extracted score as a string (e.g., '1000.00'), or an error message
-             if the image is not found, invalid, or no suitable score is detected.
+        easyocr.Reader: The cached reader instance.
     """
-    if not os.path.exists(image_path):
-        print(f"Error: Image file not found at {image_path}")
-        return None
+    reader = easyocr.Reader(['en'], gpu=gpu, cudnn_benchmark=True)
 
-    cv_image_original = cv2.imread(image_path)
-    if cv_image_original is None:
-        print(f"Error: Could not load image with OpenCV at {image_path}. Check file path and integrity.")
-        return None
+    if half and reader.device == 'cuda':
+        reader.detector = _HalfPrecisionModule(reader.detector)
+        reader.recognizer = _HalfPrecisionModule(reader.recognizer)
+        logger.debug("Running EasyOCR detector and recognizer in FP16.")
+
+    return reader
+
+
+def _crop_score_region(cv_image_original, debug=False, crop=True):
+    """
+    Crops the region where the game score is expected out of a decoded screenshot.
+
+    Args:
+        cv_image_original (numpy.ndarray): The decoded BGR screenshot.
+        debug (bool): If True, also writes the crop to 'cropped_score_region.png'.
+        crop (bool): If False, the image is taken to already be the score region
+                     (e.g. a clipped browser screenshot) and is returned as is.
 
+    Returns:
+        numpy.ndarray | None: The cropped BGR region, or None if the crop region is empty.
+    """
     h, w, _ = cv_image_original.shape
-    print(f"Original image dimensions: Width={w}, Height={h}")
+    assert h > 0 and w > 0
+    logger.debug("Original image dimensions: Width=%d, Height=%d", w, h)
 
-    x1_crop = 0
-    x2_crop = int(w * 0.5)
-    y1_crop = int(h * 0.1)
-    y2_crop = int(h * 0.9)
+    if not crop:
+        return cv_image_original
 
-    print(f"Cropping image to region: (x1={x1_crop}, y1={y1_crop}, x2={x2_crop}, y2={y2_crop})")
+    x1_crop = int(w * SCORE_REGION[0])
+    y1_crop = int(h * SCORE_REGION[1])
+    x2_crop = int(w * SCORE_REGION[2])
+    y2_crop = int(h * SCORE_REGION[3])
 
-    x1_crop = max(0, x1_crop)
-    y1_crop = max(0, y1_crop)
-    x2_crop = min(w, x2_crop)
-    y2_crop = min(h, y2_crop)
+    logger.debug("Cropping image to region: (x1=%d, y1=%d, x2=%d, y2=%d)", x1_crop, y1_crop, x2_crop, y2_crop)
 
     if x1_crop >= x2_crop or y1_crop >= y2_crop:
-        print("Warning: Custom crop region results in an empty or invalid image. Adjust crop coordinates carefully.")
-        return "Invalid custom crop region."
+        logger.warning("Custom crop region results in an empty or invalid image. Adjust crop coordinates carefully.")
+        return None
 
+    # The bounds check above guarantees a non-empty slice.
     cropped_image = cv_image_original[y1_crop:y2_crop, x1_crop:x2_crop]
 
-    if cropped_image.shape[0] == 0 or cropped_image.shape[1] == 0:
-        print("Warning: Cropped image is empty after custom crop. This might indicate incorrect crop coordinates.")
-        return "Empty cropped image after crop."
+    if debug or DEBUG:
+        output_cropped_path = "cropped_score_region.png"
+        cv2.imwrite(output_cropped_path, cropped_image)
+        logger.debug("Saved cropped image to: %s", output_cropped_path)
 
-    output_cropped_path = "cropped_score_region.png"
-    cv2.imwrite(output_cropped_path, cropped_image)
-    print(f"Saved cropped image to: {output_cropped_path}")
+    return cropped_image
 
-    print("Sending custom cropped region to EasyOCR for text detection and recognition.")
 
+def _read_image(image_path):
+    """
+    Decodes an image file to BGR at 1/DECODE_REDUCTION scale, through Pillow when
+    available and OpenCV otherwise.
+
+    The file is read into memory once and both decoders work on that buffer, so there
+    is no separate existence check or second open of the file.
+
+    Args:
+        image_path (str): The file path to the image.
+
+    Returns:
+        numpy.ndarray | None: The decoded BGR image, or None if the file could not be
+                              read or decoded.
+    """
     try:
-        gray_image = cv2.cvtColor(cropped_image, cv2.COLOR_BGR2GRAY)
-        results = reader.readtext(gray_image, allowlist='0123456789.', detail=0)
+        with open(image_path, 'rb') as image_file:
+            buf = image_file.read()
+    except OSError as e:
+        logger.error("Could not read image file at %s: %s", image_path, e)
+        return None
+
+    if Image is not None:
+        try:
+            with Image.open(io.BytesIO(buf)) as pil_image:
+                full_width = pil_image.width
+                # JPEGs can be decoded straight at a reduced scale; other formats ignore this.
+                pil_image.draft("RGB", (full_width // DECODE_REDUCTION, pil_image.height // DECODE_REDUCTION))
+                remaining_reduction = round(pil_image.width * DECODE_REDUCTION / full_width)
+                if remaining_reduction > 1:
+                    pil_image = pil_image.reduce(remaining_reduction)
+                return cv2.cvtColor(np.asarray(pil_image.convert("RGB")), cv2.COLOR_RGB2BGR)
+        except OSError:
+            pass # Let OpenCV have a go at formats Pillow cannot read
+
+    cv_image = cv2.imdecode(np.frombuffer(buf, np.uint8), _IMREAD_FLAGS[DECODE_REDUCTION])
+    if cv_image is None:
+        logger.error("Could not decode image at %s. Check file integrity.", image_path)
+    return cv_image
+
+
+def _load_cropped_score_region(image_path, debug=False, crop=True):
+    """
+    Loads an image from disk and crops the region where the game score is expected.
 
-        string_results = [str(item) for item in results if isinstance(item, (str, int, float))]
-        full_ocr_text = " ".join(string_results)
+    Args:
+        image_path (str): The file path to the game screenshot image.
+        debug (bool): If True, also writes the crop to 'cropped_score_region.png'.
+        crop (bool): If False, the image is taken to already be the score region.
+
+    Returns:
+        numpy.ndarray | None: The cropped BGR region, or None if the image could not be
+                              loaded or the crop region is empty.
+    """
+    cv_image_original = _read_image(image_path)
+    if cv_image_original is None:
+        return None
+
+    return _crop_score_region(cv_image_original, debug, crop)
+
+
+def _prepare_for_ocr(cropped_image, dst=None):
+    """
+    Binarizes a score crop into black glyphs on a white background, so EasyOCR's
+    detector does not propose boxes over low-contrast background detail.
+
+    Args:
+        cropped_image (numpy.ndarray): The BGR score crop.
+        dst (numpy.ndarray | None): Optional single-channel array to write the result into.
+
+    Returns:
+        numpy.ndarray: The binarized crop as a single-channel image.
+    """
+    return cv2.bitwise_not(binarize(cropped_image), dst=dst)
+
+
+def _prepare_for_ocr_opencl(cropped_image, size):
+    """
+    OpenCL counterpart of resizing and `_prepare_for_ocr`: the crop is uploaded once and
+    resized and binarized as a UMat, and only the final mask is downloaded.
+
+    Args:
+        cropped_image (numpy.ndarray): The BGR score crop.
+        size (tuple[int, int]): The (width, height) to scale the crop to.
+
+    Returns:
+        numpy.ndarray: The single-channel image with dark glyphs on a white background.
+    """
+    image = cv2.UMat(np.ascontiguousarray(cropped_image))
+    if cropped_image.shape[1::-1] != size:
+        image = cv2.resize(image, size, interpolation=_resize_interpolation(cropped_image, size[1]))
+    return cv2.bitwise_not(binarize(image)).get()
 
-        if full_ocr_text:
-            print(f"EasyOCR raw text from custom cropped region: '{full_ocr_text}'")
 
-            numbers_candidates = re.findall(r'\b\d+\.\d{2}\b|\b\d+\b', full_ocr_text)
-            print(f"Raw number candidates from regex: {numbers_candidates}")
+def _is_digit(c):
+    return '0' <= c <= '9'
 
-            final_score_candidates = []
-            for num_str in numbers_candidates:
-                if 1 <= len(num_str) <= 7:
-                    final_score_candidates.append(num_str)
 
-            final_score = "No suitable score found."
+def _is_word_char(c):
+    return c.isalnum() or c == '_'
 
-            if final_score_candidates:
-                decimal_scores = [s for s in final_score_candidates if '.' in s]
-                integer_scores = [s for s in final_score_candidates if '.' not in s]
 
-                if decimal_scores:
-                    final_score = max(decimal_scores, key=len)
-                elif integer_scores:
-                    final_score = max(integer_scores, key=len)
+def _longer_candidate(best, candidate):
+    """Returns `candidate` if it is 1 to 7 characters and longer than `best`, else `best`."""
+    return candidate if len(best) < len(candidate) <= 7 else best
 
-                print(f"Final score candidates after filtering: {final_score_candidates}")
+
+def _scan_scores(text):
+    """
+    Finds the score candidates (`NNN.NN` or `NNN`, on word boundaries) in a single pass
+    of a small DFA, keeping only the longest decimal and the longest integer of 1 to 7
+    characters.
+
+    A full-format decimal score (e.g. '1000.00') is what we are after, so the first one
+    found is returned straight away.
+
+    Args:
+        text (str): The text of one OCR box.
+
+    Returns:
+        tuple[str, str]: The best decimal and the best integer candidate ('' if none).
+    """
+    best_decimal = ""
+    best_integer = ""
+    state = _START
+    start = 0 # First character of the current candidate
+    dot = 0 # Position of the '.' in a decimal candidate
+    n = len(text)
+    i = 0
+    while i <= n:
+        # A trailing space flushes whatever candidate is still open.
+        c = text[i] if i < n else ' '
+
+        if state == _START:
+            if _is_digit(c):
+                state = _INT
+                start = i
+            elif _is_word_char(c):
+                state = _WORD
+            i += 1
+        elif state == _WORD:
+            if not _is_word_char(c):
+                state = _START
+            i += 1
+        elif state == _INT:
+            if c == '.':
+                state = _DOT
+                dot = i
+            elif not _is_digit(c):
+                if _is_word_char(c):
+                    state = _WORD # '12a' is not a number
+                else:
+                    best_integer = _longer_candidate(best_integer, text[start:i])
+                    state = _START
+            i += 1
+        elif state == _DOT:
+            if _is_digit(c):
+                state = _FRAC1
+                i += 1
+            else:
+                # '12.' - the integer stands alone and `c` is read again from the start.
+                best_integer = _longer_candidate(best_integer, text[start:dot])
+                state = _START
+        elif state == _FRAC1:
+            if _is_digit(c):
+                state = _FRAC2
+                i += 1
             else:
-                print("No suitable numerical score found after advanced filtering and prioritization.")
+                # '12.3' - both sides are integers of their own; `c` continues the second.
+                best_integer = _longer_candidate(best_integer, text[start:dot])
+                start = dot + 1
+                state = _INT
+        else: # _FRAC2
+            if not _is_word_char(c):
+                candidate = text[start:i]
+                if len(candidate) <= 7:
+                    if len(candidate) >= 5:
+                        return candidate, best_integer
+                    if len(candidate) > len(best_decimal):
+                        best_decimal = candidate
+                state = _START
+                i += 1
+            else:
+                # '12.345' or '12.34a' - no decimal; fall back as for '12.3'.
+                best_integer = _longer_candidate(best_integer, text[start:dot])
+                start = dot + 1
+                state = _INT
 
-            return final_score
+    return best_decimal, best_integer
 
-        else:
-            print("EasyOCR found no text in the custom cropped region.")
-            return "No text found by EasyOCR."
 
+def _select_score(results):
+    """
+    Picks the most plausible game score out of the text fragments EasyOCR returned
+    for a single image.
+
+    Args:
+        results (list[str]): The `detail=0` EasyOCR output for one image.
+
+    Returns:
+        str: The extracted score, or a message if no suitable score is detected.
+    """
+    if not any(results):
+        logger.debug("EasyOCR found no text in the custom cropped region.")
+        return "No text found by EasyOCR."
+
+    logger.debug("EasyOCR raw text from custom cropped region: %s", results)
+
+    # Candidates never span boxes, so each box's text is scanned on its own.
+    best_decimal = ""
+    best_integer = ""
+    for text in results:
+        decimal, integer = _scan_scores(text)
+        best_integer = _longer_candidate(best_integer, integer)
+        if len(decimal) >= 5:
+            return decimal
+        best_decimal = _longer_candidate(best_decimal, decimal)
+
+    final_score = best_decimal or best_integer
+    if not final_score:
+        logger.debug("No suitable numerical score found after advanced filtering and prioritization.")
+        return "No suitable score found."
+
+    logger.debug("Best decimal candidate: '%s', best integer candidate: '%s'", best_decimal, best_integer)
+    return final_score
+
+
+def read_game_scores_batched(image_paths, debug=False, crop=True, batch_size=BATCH_SIZE):
+    """
+    Reads the game score from several screenshots with a single batched EasyOCR pass.
+
+    Every image is cropped to the score region. Crops are first read with the digit
+    templates (see `collect_digit_templates`); those that do not match confidently are
+    binarized, resized to the shape of the first one and read together in one EasyOCR
+    recognizer call (see `_run_easyocr`).
+
+    Paths are read in chunks of `batch_size`; while one chunk is being read, the next is
+    decoded and cropped on a small thread pool, so file I/O and decoding overlap with OCR.
+
+    Args:
+        image_paths (list[str]): The file paths to the game screenshot images.
+        debug (bool): If True, also writes each crop to 'cropped_score_region.png'.
+        crop (bool): If False, the images are taken to already be score regions.
+        batch_size (int): How many crops the recognizer processes per forward pass.
+
+    Returns:
+        list[str | None]: One entry per input path, in order: the extracted score as a
+                          string, a message if no suitable score is detected, or None
+                          if the image could not be loaded or processed.
+    """
+    load = functools.partial(_load_cropped_score_region, debug=debug, crop=crop)
+    if len(image_paths) <= batch_size:
+        return _read_scores_from_crops([load(image_path) for image_path in image_paths], batch_size)
+
+    scores = []
+    with ThreadPoolExecutor(max_workers=DECODE_WORKERS) as executor:
+        pending = [executor.submit(load, image_path) for image_path in image_paths[:batch_size]]
+        for start in range(0, len(image_paths), batch_size):
+            crops = [future.result() for future in pending]
+            # Decode the next chunk while this one is being read.
+            next_paths = image_paths[start + batch_size:start + 2 * batch_size]
+            pending = [executor.submit(load, image_path) for image_path in next_paths]
+            scores.extend(_read_scores_from_crops(crops, batch_size))
+    return scores
+
+
+def _crop_key(cropped_image):
+    """
+    Hashes a crop's pixels, so identical frames (the score only changes on payouts)
+    can reuse an earlier result.
+
+    Args:
+        cropped_image (numpy.ndarray): The BGR score crop.
+
+    Returns:
+        tuple: A cache key made of the crop shape and its pixel digest.
+    """
+    # The crop is a strided view into the screenshot; hashing needs contiguous bytes.
+    pixels = scratch_buffer("crop_key", cropped_image.shape, cropped_image.dtype)
+    np.copyto(pixels, cropped_image)
+    if xxhash is not None:
+        return pixels.shape, xxhash.xxh3_64_intdigest(pixels)
+    return pixels.shape, hashlib.blake2b(pixels, digest_size=8).digest()
+
+
+def _average_hash(cropped_image):
+    """
+    Computes the 64-bit average hash of a crop: one bit per cell of an 8x8 grayscale
+    thumbnail, set where the cell is brighter than the thumbnail's mean.
+
+    Args:
+        cropped_image (numpy.ndarray): The BGR score crop.
+
+    Returns:
+        int: The hash; similar crops differ in few bits.
+    """
+    thumbnail = cv2.resize(cropped_image, (8, 8), interpolation=cv2.INTER_AREA)
+    if thumbnail.ndim == 3:
+        thumbnail = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2GRAY)
+    return int.from_bytes(np.packbits(thumbnail > thumbnail.mean()).tobytes(), "big")
+
+
+def _get_cached_score(key):
+    with _score_cache_lock:
+        score = _score_cache.get(key)
+        if score is not None:
+            _score_cache.move_to_end(key)
+        return score
+
+
+def _get_similar_score(average_hash):
+    """Returns the cached score of a crop within FUZZY_CACHE_DISTANCE bits, or None."""
+    with _score_cache_lock:
+        for cached_hash, score in _fuzzy_score_cache.items():
+            if (cached_hash ^ average_hash).bit_count() <= FUZZY_CACHE_DISTANCE:
+                _fuzzy_score_cache.move_to_end(cached_hash)
+                return score
+        return None
+
+
+def _cache_score(key, score, average_hash=None):
+    with _score_cache_lock:
+        _score_cache[key] = score
+        _score_cache.move_to_end(key)
+        if len(_score_cache) > SCORE_CACHE_SIZE:
+            _score_cache.popitem(last=False)
+
+        if average_hash is not None:
+            _fuzzy_score_cache[average_hash] = score
+            _fuzzy_score_cache.move_to_end(average_hash)
+            if len(_fuzzy_score_cache) > SCORE_CACHE_SIZE:
+                _fuzzy_score_cache.popitem(last=False)
+
+
+def _recognize(reader, image, boxes, batch_size):
+    """
+    Runs EasyOCR's recognizer directly on known text boxes, skipping CRAFT detection.
+
+    Args:
+        reader (easyocr.Reader): The EasyOCR reader.
+        image (numpy.ndarray): The grayscale image holding the boxes.
+        boxes (list[list[int]]): One `[x_min, x_max, y_min, y_max]` box per text line.
+        batch_size (int): How many boxes the recognizer processes per forward pass.
+
+    Returns:
+        list[str]: The recognized text per box, top to bottom.
+    """
+    # Batched recognition returns gibberish on Apple's MPS backend; keep it at 1 there.
+    if reader.device == 'mps':
+        batch_size = 1
+    # Nothing here is ever backpropagated; skip autograd's bookkeeping entirely.
+    with torch.inference_mode():
+        return reader.recognize(
+            image,
+            horizontal_list=boxes,
+            free_list=[],
+            allowlist='0123456789.',
+            detail=0,
+            batch_size=batch_size,
+            workers=0,
+            paragraph=False,
+        )
+
+
+def _resize_interpolation(image, height):
+    """Area averaging to shrink `image` to `height`, bicubic to enlarge it."""
+    return cv2.INTER_AREA if image.shape[0] > height else cv2.INTER_CUBIC
+
+
+def _stacked_boxes(count, crop_h, crop_w):
+    """Returns one recognizer box per crop for `count` crops stacked top to bottom."""
+    return [[0, crop_w, slot * crop_h, (slot + 1) * crop_h] for slot in range(count)]
+
+
+def warmup(crop_size=(64, 256), batch_size=BATCH_SIZE):
+    """
+    Loads the EasyOCR reader and runs one dummy recognizer batch, so the first real read
+    does not pay for model loading and CUDA initialization. Meant to be called once from
+    long-running processes at start-up (see `ocr_server.serve`); one-off reads skip it.
+
+    cuDNN still tunes its kernels for each new input shape the first time it is seen, so
+    this only avoids that for reads whose batch matches `crop_size` and `batch_size`.
+
+    Args:
+        crop_size (tuple[int, int]): The (height, width) of the crops that will be read.
+        batch_size (int): The batch size that will be used for reads.
+    """
+    crop_h, crop_w = crop_size
+    _recognize(get_reader(), np.zeros((batch_size * crop_h, crop_w), dtype=np.uint8), _stacked_boxes(batch_size, crop_h, crop_w), batch_size)
+
+
+def _run_easyocr(cropped_images, batch_size):
+    """
+    Reads score crops with one EasyOCR recognizer pass.
+
+    The score sits at a fixed place and SCORE_REGION covers just its line, so there is
+    nothing for the CRAFT detector to find: the crops are scaled to the recognizer's
+    input height, stacked into one tall image and each crop is handed to the recognizer
+    as a ready-made text box.
+
+    Args:
+        cropped_images (list[numpy.ndarray]): BGR score crops; all are scaled to the
+                                              aspect ratio of the first one.
+        batch_size (int): How many crops the recognizer processes per forward pass.
+
+    Returns:
+        list[list[str]]: The `detail=0` EasyOCR output per crop, or an empty list if
+                         EasyOCR failed.
+    """
+    # Each crop is a single text line (see SCORE_REGION), so it can be brought to the
+    # recognizer's line height up front: the binarization then works at the resolution the
+    # recognizer reads, and the recognizer's own resize has nothing left to do.
+    first_h, first_w = cropped_images[0].shape[:2]
+    crop_h = RECOGNIZER_HEIGHT
+    crop_w = max(1, round(first_w * crop_h / first_h))
+    batch = np.empty((len(cropped_images), crop_h, crop_w), dtype=np.uint8)
+    for slot, cropped_image in enumerate(cropped_images):
+        if _USE_OPENCL:
+            batch[slot] = _prepare_for_ocr_opencl(cropped_image, (crop_w, crop_h))
+            continue
+        if cropped_image.shape[:2] != (crop_h, crop_w):
+            resized = scratch_buffer("resized", (crop_h, crop_w) + cropped_image.shape[2:], cropped_image.dtype)
+            cropped_image = cv2.resize(cropped_image, (crop_w, crop_h), dst=resized, interpolation=_resize_interpolation(cropped_image, crop_h))
+        _prepare_for_ocr(cropped_image, dst=batch[slot])
+
+    boxes = _stacked_boxes(len(cropped_images), crop_h, crop_w)
+
+    logger.debug("Sending %d cropped region(s) to the EasyOCR recognizer.", len(cropped_images))
+
+    try:
+        texts = _recognize(get_reader(), batch.reshape(-1, crop_w), boxes, batch_size)
     except Exception as e:
-        print(f"An unexpected error occurred during EasyOCR processing: {e}")
+        logger.error("An unexpected error occurred during EasyOCR processing: %s", e)
+        return []
+
+    return [[text] for text in texts]
+
+
+def _read_scores_from_crops(crops, batch_size=BATCH_SIZE):
+    """
+    Reads the game score from already-cropped score regions; see `read_game_scores_batched`.
+
+    Crops identical to a recently read one are answered from a small LRU cache, as are
+    near-identical ones when FUZZY_CACHE_DISTANCE is set.
+
+    Args:
+        crops (list[numpy.ndarray | None]): BGR score crops; None entries are skipped.
+        batch_size (int): How many crops the recognizer processes per forward pass.
+
+    Returns:
+        list[str | None]: One score (or message) per crop, None for skipped crops.
+    """
+    scores = [None] * len(crops)
+
+    keys = {}
+    average_hashes = {}
+    for i, cropped_image in enumerate(crops):
+        if cropped_image is None:
+            continue
+        key = _crop_key(cropped_image)
+        cached_score = _get_cached_score(key)
+        if cached_score is not None:
+            logger.debug("Score region unchanged, reusing '%s'.", cached_score)
+            scores[i] = cached_score
+            continue
+
+        if FUZZY_CACHE_DISTANCE is not None:
+            average_hash = average_hashes[i] = _average_hash(cropped_image)
+            cached_score = _get_similar_score(average_hash)
+            if cached_score is not None:
+                logger.debug("Score region nearly unchanged, reusing '%s'.", cached_score)
+                scores[i] = cached_score
+                continue
+        keys[i] = key
+
+    templates = load_templates()
+    ocr_indices = []
+    for i in keys:
+        text, confidence = match_digits(crops[i], templates)
+        if confidence >= MATCH_THRESHOLD:
+            logger.debug("Digit templates matched '%s' (confidence %.2f).", text, confidence)
+            scores[i] = _select_score([text])
+        else:
+            ocr_indices.append(i)
+
+    if ocr_indices:
+        batch_results = _run_easyocr([crops[i] for i in ocr_indices], batch_size)
+        for i, results in zip(ocr_indices, batch_results):
+            scores[i] = _select_score(results)
+
+    for i, key in keys.items():
+        if scores[i] is not None:
+            _cache_score(key, scores[i], average_hashes.get(i))
+
+    return scores
+
+
+def read_game_score_custom_crop(image_path, debug=False, crop=True):
+    """
+    Crops a specific region of the image where the game score is expected to be
+    and uses EasyOCR to read the score, handling decimal points.
+
+    Args:
+        image_path (str): The file path to the game screenshot image (e.g., 'game_screenshot.png').
+        debug (bool): If True, also writes the crop to 'cropped_score_region.png'.
+        crop (bool): If False, the image is taken to already be the score region.
+
+    Returns:
+        str: The extracted score as a string (e.g., '1000.00'), a message if no suitable
+             score is detected, or None if the image is not found or invalid.
+    """
+    return read_game_scores_batched([image_path], debug, crop)[0]
+
+
+def _decode_image(buf, size=None):
+    """
+    Decodes an in-memory image to BGR.
+
+    Args:
+        buf (bytes): An encoded (PNG/JPEG) image, or raw RGBA pixels if `size` is given.
+        size (tuple[int, int] | None): The (width, height) of raw RGBA pixels.
+
+    Returns:
+        numpy.ndarray | None: The decoded BGR image, or None if it could not be decoded.
+    """
+    if size is None:
+        cv_image_original = cv2.imdecode(np.frombuffer(buf, np.uint8), cv2.IMREAD_COLOR)
+        if cv_image_original is None:
+            logger.error("Could not decode image bytes with OpenCV.")
+        return cv_image_original
+
+    width, height = size
+    if width <= 0 or height <= 0:
+        logger.error("Invalid RGBA image size %dx%d.", width, height)
+        return None
+    if len(buf) != width * height * 4:
+        logger.error("Expected %d RGBA bytes for a %dx%d image, got %d.", width * height * 4, width, height, len(buf))
         return None
 
+    rgba_image = np.frombuffer(buf, np.uint8).reshape(height, width, 4)
+    return cv2.cvtColor(rgba_image, cv2.COLOR_RGBA2BGR)
 
-if __name__ == "__main__":
 
-    # Initialize EasyOCR reader once.
-    reader = easyocr.Reader(['en'], gpu=True)
+def read_game_scores_from_buffers(requests, debug=False, batch_size=BATCH_SIZE):
+    """
+    Reads the game score from several in-memory images with a single batched pass.
+
+    Args:
+        requests (list[tuple[bytes, tuple[int, int] | None, bool]]): One `(buf, size, crop)`
+            per image, where `size` is the (width, height) of raw RGBA pixels or None for
+            an encoded screenshot, and `crop` is False if the image is already the score
+            region.
+        debug (bool): If True, also writes each crop to 'cropped_score_region.png'.
+        batch_size (int): How many crops the recognizer processes per forward pass.
+
+    Returns:
+        list[str | None]: One entry per request, in order, as for `read_game_scores_batched`.
+    """
+    crops = []
+    for buf, size, crop in requests:
+        cv_image_original = _decode_image(buf, size)
+        crops.append(None if cv_image_original is None else _crop_score_region(cv_image_original, debug, crop))
+    return _read_scores_from_crops(crops, batch_size)
+
+
+def read_game_score_from_bytes(buf, debug=False, crop=True):
+    """
+    Reads the game score from an encoded screenshot held in memory, e.g. the bytes
+    returned by Playwright's `screenshot()`, without a round-trip through the disk.
+
+    Args:
+        buf (bytes): The encoded (PNG/JPEG) screenshot.
+        debug (bool): If True, also writes the crop to 'cropped_score_region.png'.
+        crop (bool): If False, the image is taken to already be the score region.
+
+    Returns:
+        str: The extracted score as a string (e.g., '1000.00'), a message if no suitable
+             score is detected, or None if the bytes could not be decoded.
+    """
+    return read_game_scores_from_buffers([(buf, None, crop)], debug)[0]
+
+
+def read_game_score_from_rgba(buf, width, height, debug=False, crop=True):
+    """
+    Reads the game score from raw RGBA pixels, e.g. copied out of the game canvas with
+    `getImageData`, so no image codec is involved at all.
+
+    Args:
+        buf (bytes): The pixel data, `width * height * 4` bytes in RGBA order.
+        width (int): The image width in pixels.
+        height (int): The image height in pixels.
+        debug (bool): If True, also writes the crop to 'cropped_score_region.png'.
+        crop (bool): If False, the image is taken to already be the score region.
+
+    Returns:
+        str: The extracted score as a string (e.g., '1000.00'), a message if no suitable
+             score is detected, or None if the pixels do not match the given size.
+    """
+    return read_game_scores_from_buffers([(buf, (width, height), crop)], debug)[0]
+
+
+def collect_digit_templates(image_paths, crop=True):
+    """
+    Builds digit templates by labelling score crops with EasyOCR.
+
+    Run this once over a few hundred screenshots; afterwards most reads are served by
+    template matching and EasyOCR is only used as a fallback. Crops whose glyph count
+    does not match the length of the EasyOCR score are skipped.
+
+    Args:
+        image_paths (list[str]): The file paths to the game screenshot images.
+        crop (bool): If False, the images are taken to already be score regions.
+
+    Returns:
+        int: The number of crops whose glyphs were saved as templates.
+    """
+    reader = get_reader()
+    labelled = 0
+
+    for image_path in image_paths:
+        cropped_image = _load_cropped_score_region(image_path, crop=crop)
+        if cropped_image is None:
+            continue
+
+        ocr_input = _prepare_for_ocr(cropped_image)
+        # The crop is already small; keep CRAFT from magnifying it before detection.
+        with torch.inference_mode():
+            results = reader.readtext(
+                ocr_input,
+                allowlist='0123456789.',
+                detail=0,
+                batch_size=BATCH_SIZE,
+                workers=0,
+                paragraph=False,
+                canvas_size=max(ocr_input.shape),
+                mag_ratio=1.0,
+            )
+        score = _select_score(results)
+        if not score[0].isdigit():
+            continue # One of `_select_score`'s "No ..." messages
+
+        glyphs = segment_glyphs(binarize(cropped_image))
+        if len(glyphs) != len(score):
+            logger.debug("Skipping %s: %d glyphs for score '%s'.", image_path, len(glyphs), score)
+            continue
+
+        save_templates(glyphs, score)
+        labelled += 1
+
+    load_templates.cache_clear()
+    logger.info("Collected digit templates from %d of %d image(s).", labelled, len(image_paths))
+    return labelled
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
 
     image_file = 'game_screenshot.png'
 
     print("Firing things up...")
-    score = read_game_score_custom_crop(image_file)
+    score = read_game_score_custom_crop(image_file, debug=True)
 
     if score is not None:
         print(f"\nExtracted Score: {score}")